@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Build a single-file zipapp with precompiled bytecode and frozen levels.
+
+    python3 build_zipapp.py -o ../dist/cman.pyz
+    CMAN_TIMING=1 python3 ../dist/cman.pyz
+
+The archive holds only .pyc files, so it must run on the same Python
+version that built it; any other version exits with a message.
+"""
+import argparse
+import os
+import py_compile
+import sys
+import tempfile
+import zipapp
+from level_loader import list_level_files, load_level_file
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+SKIP = {"build_zipapp.py"}
+
+# Checks the interpreter before importing any .pyc; {built} is filled in by build()
+MAIN = '''import sys
+BUILT_FOR = {built!r}
+if sys.version_info[:2] != BUILT_FOR:
+    sys.exit("cman.pyz was built for Python %d.%d but this is Python %d.%d; "
+             "run it with python%d.%d or rebuild it" % (BUILT_FOR + sys.version_info[:2] + BUILT_FOR))
+from cman import main
+try:
+    main()
+except KeyboardInterrupt:
+    pass
+'''
+
+def compile_source(source, name, staging):
+    """Write source to a temp file and compile it to staging/name.pyc."""
+    path = os.path.join(staging, name + ".py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    py_compile.compile(path, cfile=os.path.join(staging, name + ".pyc"), dfile=name + ".py",
+                       doraise=True, invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    os.remove(path)
+
+def freeze_levels():
+    """Levels as a module; load_level_file validates each one at build time."""
+    levels = {f: tuple(load_level_file(f)) for f in list_level_files()}
+    return f'"""Levels frozen by build_zipapp.py."""\nLEVELS = {levels!r}\n', len(levels)
+
+def build(output):
+    with tempfile.TemporaryDirectory() as staging:
+        for filename in sorted(os.listdir(SRC_DIR)):
+            if not filename.endswith(".py") or filename in SKIP:
+                continue
+            with open(os.path.join(SRC_DIR, filename), encoding="utf-8") as f:
+                compile_source(f.read(), filename[:-3], staging)
+        levels, count = freeze_levels()
+        compile_source(levels, "frozen_levels", staging)
+        # zipapp requires a __main__.py source; it is only a tiny stub
+        with open(os.path.join(staging, "__main__.py"), "w", encoding="utf-8") as f:
+            f.write(MAIN.format(built=tuple(sys.version_info[:2])))
+
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        # Stored, not deflated: decompression would cost more than it saves
+        zipapp.create_archive(staging, output, interpreter="/usr/bin/env python3")
+    print(f"Built {output} ({count} levels, Python {sys.version_info.major}.{sys.version_info.minor})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Cman zipapp.")
+    parser.add_argument("-o", "--output", default=os.path.join(SRC_DIR, "..", "dist", "cman.pyz"))
+    build(parser.parse_args().output)
+
+if __name__ == "__main__":
+    main()
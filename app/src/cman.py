@@ -1,19 +1,57 @@
 #!/usr/bin/env python3
 """Cman game - main entry point."""
+import os
+import time
+STARTED = time.perf_counter()
+
+def process_age():
+    """Seconds since this process was created (Linux, clock-tick resolution)."""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+# Interpreter startup plus zipimport/compile of __main__ and this module
+BOOT = process_age()
+
 import curses
 import locale
-import os
+import sys
 from level_loader import list_level_files, load_level_file, get_initial_level
-from game_engine import simulate
 from landing import show_landing
 
 locale.setlocale(locale.LC_ALL, "")
 
+SHOW_TIMING = bool(os.environ.get('CMAN_TIMING'))
+IMPORTED = time.perf_counter()
+
 def main():
+    timing = {}
+    if BOOT is not None:
+        timing["interpreter start"] = BOOT
+    timing["app imports"] = IMPORTED - STARTED
+    try:
+        run(timing)
+    finally:
+        if SHOW_TIMING:
+            origin = "process start" if BOOT is not None else "cman import (interpreter start unknown)"
+            print(f"Startup timing (first landing frame measured from {origin}):", file=sys.stderr)
+            for step, secs in timing.items():
+                print(f"  {step:<20} {secs * 1000:7.1f} ms", file=sys.stderr)
+
+def run(timing):
     # Show landing page
-    if not curses.wrapper(show_landing):
+    def first_frame():
+        timing["first landing frame"] = (BOOT or 0.0) + time.perf_counter() - STARTED
+
+    if not curses.wrapper(show_landing, first_frame):
         return  # User quit
     
+    # Deferred so the landing page doesn't wait on the game engine
+    from game_engine import simulate
+
     files = list_level_files()
     
     # Check for LEVEL environment variable
@@ -37,7 +75,9 @@ def main():
         filename = files[current_level]
         title = os.path.splitext(filename)[0]
         print(f"Loading: {filename}")
+        start = time.perf_counter()
         LEVEL = load_level_file(filename)
+        timing.setdefault("level load", time.perf_counter() - start)
         
         if game_state:
             result = curses.wrapper(simulate, LEVEL, title, game_state[0], game_state[1])
@@ -6,6 +6,14 @@ PAC_SPEED = 7
 GHOST_SPEED = 6
 POWER_TIME = 8.0
 HOME_TIME = 2.0
+SHIELD_TIME = 1.0
+FRIGHT_FLASH_TIME = 2.0
+
+# Lookahead (hard) ghost AI
+LOOKAHEAD_DEPTH = 12
+LOOKAHEAD_BUDGET = 0.004       # Seconds of rollouts per ghost decision
+LOOKAHEAD_TICK_BUDGET = 0.010  # Cap on rollout time per tick, all ghosts together
+LOOKAHEAD_MIN_SAMPLES = 8      # Rollouts per candidate needed to trust the result
 
 # Game mechanics
 LIVES_START = 3
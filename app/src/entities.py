@@ -1,8 +1,12 @@
 """Game entities: Cman and Ghost classes."""
-from config import LIVES_START, HOME_TIME
+from config import LIVES_START, HOME_TIME, SHIELD_TIME, FRIGHT_FLASH_TIME
+from timers import Scheduler
+
+def _remaining(timer):
+    return timer.remaining() if timer else 0.0
 
 class Cman:
-    def __init__(self, start_pos, score=0, lives=None):
+    def __init__(self, start_pos, score=0, lives=None, timers=None):
         sx, sy = start_pos
         self.x = float(sx)
         self.y = float(sy)
@@ -10,10 +14,22 @@ class Cman:
         self.dy = 0
         self.want = (0, 0)
         self.lives = lives if lives is not None else LIVES_START
-        self.power = 0.0
-        self.shield = 1.0
+        self.timers = timers if timers is not None else Scheduler()
+        self.power_timer = None
+        self.shield_timer = self.timers.schedule(SHIELD_TIME)
         self.score = score
 
+    @property
+    def power(self):
+        return _remaining(self.power_timer)
+
+    @property
+    def shield(self):
+        return _remaining(self.shield_timer)
+
+    def power_up(self, duration):
+        self.power_timer = self.timers.reschedule(self.power_timer, duration)
+
     def reset(self, start_pos):
         sx, sy = start_pos
         self.x = float(sx)
@@ -21,11 +37,12 @@ class Cman:
         self.dx = 0
         self.dy = 0
         self.want = (0, 0)
-        self.power = 0.0
-        self.shield = 1.0
+        if self.power_timer:
+            self.power_timer.cancel()
+        self.shield_timer = self.timers.reschedule(self.shield_timer, SHIELD_TIME)
 
 class Ghost:
-    def __init__(self, home_pos, scatter):
+    def __init__(self, home_pos, scatter, timers=None):
         hx, hy = home_pos
         self.home = (hx, hy)
         self.x = float(hx)
@@ -33,11 +50,39 @@ class Ghost:
         self.dx = 0
         self.dy = 0
         self.scatter = scatter
-        self.frightened = 0.0
-        self.home_timer = 0.0
+        self.timers = timers if timers is not None else Scheduler()
+        self.frightened_timer = None
+        self.flash_timer = None
+        self.flashing = False
+        self.home_release = None
+
+    @property
+    def frightened(self):
+        return _remaining(self.frightened_timer)
+
+    @property
+    def home_timer(self):
+        return _remaining(self.home_release)
+
+    def frighten(self, duration):
+        self.flashing = False
+        self.frightened_timer = self.timers.reschedule(self.frightened_timer, duration)
+        self.flash_timer = self.timers.reschedule(
+            self.flash_timer, duration - FRIGHT_FLASH_TIME, self._start_flashing)
+
+    def _start_flashing(self):
+        self.flashing = True
 
     def reset(self):
         self.x, self.y = float(self.home[0]), float(self.home[1])
         self.dx = self.dy = 0
-        self.frightened = 0.0
-        self.home_timer = HOME_TIME
\ No newline at end of file
+        for timer in (self.frightened_timer, self.flash_timer):
+            if timer:
+                timer.cancel()
+        self.flashing = False
+        self.home_release = self.timers.reschedule(self.home_release, HOME_TIME)
+
+    def restart_home(self):
+        """Give a ghost still waiting at home the full HOME_TIME from now."""
+        if self.home_timer > 0:
+            self.home_release = self.timers.reschedule(self.home_release, HOME_TIME)
\ No newline at end of file
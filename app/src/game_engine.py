@@ -5,6 +5,9 @@ import random
 from config import *
 from entities import Cman, Ghost
 from game_utils import *
+from input_handler import InputState, handle_input, wait_frame, SHOW_LATENCY
+from lookahead import HARD_MODE, lookahead_dir
+from timers import Scheduler
 from game_state import load_game_state, save_game_state, clear_game_state
 from high_scores import add_high_score, get_top_scores, is_high_score
 
@@ -37,14 +40,16 @@ def simulate(stdscr, LEVEL, title, initial_score=None, initial_lives=None):
     
     # Spawns
     pac_start, ghost_starts, scatter_targets = find_default_spawns(LEVEL)
-    pac = Cman(pac_start, initial_score, initial_lives)
-    ghosts = [Ghost(ghost_starts[i], scatter_targets[i]) for i in range(len(ghost_starts))]
+    timers = Scheduler()
+    pac = Cman(pac_start, initial_score, initial_lives, timers)
+    ghosts = [Ghost(ghost_starts[i], scatter_targets[i], timers) for i in range(len(ghost_starts))]
 
     pellets, powers = make_pellet_map(LEVEL)
+    comps = label_components(LEVEL, W, H)
 
     last = time.perf_counter()
     running = True
-    paused = False
+    inp = InputState()
     game_started = False
     msg = ""
 
@@ -52,25 +57,26 @@ def simulate(stdscr, LEVEL, title, initial_score=None, initial_lives=None):
         now = time.perf_counter()
         dt = now - last
         if dt < 1.0 / FPS:
-            time.sleep(1.0 / FPS - dt)
+            wait_frame(inp, 1.0 / FPS - dt)
             now = time.perf_counter()
             dt = now - last
         last = now
 
-        pac.shield = max(0.0, pac.shield - dt)
-        pac.power = max(0.0, pac.power - dt)
-
-        # Input handling
-        running, paused, game_started = handle_input(stdscr, pac, paused, last, H, W, LEVEL, game_started)
-        if not running or paused:
-            if paused:
-                last = time.perf_counter()  # Reset timer
+        # Input handling (timers stay frozen while paused)
+        running = handle_input(stdscr, pac, inp, H, W, LEVEL)
+        if not running or inp.paused:
             continue
 
+        timers.advance(dt)
+
         # Move cman
+        before = (pac.x, pac.y)
         move_cman(pac, dt, LEVEL, W, H)
+        inp.track_move(pac, (pac.x, pac.y) != before)
         if (pac.dx != 0 or pac.dy != 0) and not game_started:
             game_started = True
+            for g in ghosts:
+                g.restart_home()  # Home countdown only runs while playing
 
         # Eat pellets/powers
         pac_grid = (int(pac.x), int(pac.y))
@@ -79,9 +85,9 @@ def simulate(stdscr, LEVEL, title, initial_score=None, initial_lives=None):
             pac.score += PELLET_POINTS
         if pac_grid in powers:
             powers.remove(pac_grid)
-            pac.power = POWER_TIME
+            pac.power_up(POWER_TIME)
             for g in ghosts: 
-                g.frightened = POWER_TIME
+                g.frighten(POWER_TIME)
 
         # Collisions
         running, game_started = handle_collisions(pac, ghosts, pac_start, game_started)
@@ -91,11 +97,7 @@ def simulate(stdscr, LEVEL, title, initial_score=None, initial_lives=None):
 
         # Move ghosts
         if game_started:
-            move_ghosts(ghosts, pac, LEVEL, W, H, dt, game_started)
-
-        # Update frightened timers
-        for g in ghosts:
-            g.frightened = max(0.0, g.frightened - dt)
+            move_ghosts(ghosts, pac, LEVEL, W, H, dt, game_started, comps)
 
         # Win condition
         if not pellets and not powers:
@@ -105,7 +107,8 @@ def simulate(stdscr, LEVEL, title, initial_score=None, initial_lives=None):
 
         # Render
         render_game(stdscr, LEVEL, pac, ghosts, pellets, powers, title, 
-                   PAC_COLOR, GHOST_COLOR, FRIGHT_COL, MAZE_COLOR)
+                   PAC_COLOR, GHOST_COLOR, FRIGHT_COL, MAZE_COLOR,
+                   inp.latency() if SHOW_LATENCY else None)
 
     # Save state and show game over screen
     if pac.lives < 0:
@@ -119,41 +122,6 @@ def simulate(stdscr, LEVEL, title, initial_score=None, initial_lives=None):
         save_game_state(pac.score, pac.lives)
         return show_game_over(stdscr, msg, H, W, (pac.score, pac.lives))
 
-def handle_input(stdscr, pac, paused, last, H, W, LEVEL, game_started):
-    try:
-        ch = stdscr.getch()
-    except curses.error:
-        ch = -1
-    
-    if ch in (ord('q'), ord('Q')):
-        return False, paused, game_started
-    elif ch in (ord('p'), ord('P')):
-        msg_text = "PAUSED"
-        stdscr.addstr(max(1, H//2), max(0, (W - len(msg_text)) // 2), msg_text)
-        stdscr.refresh()
-        stdscr.nodelay(False)
-        stdscr.getch()
-        stdscr.nodelay(True)
-        return True, True, game_started
-
-    want = pac.want
-    if ch in (curses.KEY_UP, ord('w'), ord('W')):    
-        want = (0, -1)
-    elif ch in (curses.KEY_DOWN, ord('s'), ord('S')): 
-        want = (0, 1)
-    elif ch in (curses.KEY_LEFT, ord('a'), ord('A')): 
-        want = (-1, 0)
-    elif ch in (curses.KEY_RIGHT, ord('d'), ord('D')):
-        want = (1, 0)
-    
-    pac.want = want
-    if want != (0, 0):
-        nx, ny = wrap_xy(pac.x + want[0], pac.y + want[1], W, H)
-        if not is_wall(LEVEL, int(nx), int(ny), W, H):
-            pac.dx, pac.dy = want
-    
-    return True, False, game_started
-
 def move_cman(pac, dt, LEVEL, W, H):
     if pac.dx != 0 or pac.dy != 0:
         speed_x = PAC_SPEED * dt
@@ -170,7 +138,7 @@ def handle_collisions(pac, ghosts, pac_start, game_started):
         if distance < COLLISION_THRESHOLD:
             if g.frightened > 0:
                 pac.score += GHOST_POINTS
-                g.reset()  # This sets home_timer = HOME_TIME
+                g.reset()  # Schedules release from home after HOME_TIME
             else:
                 if pac.shield > 0:
                     continue
@@ -184,16 +152,15 @@ def handle_collisions(pac, ghosts, pac_start, game_started):
                 return True, False  # Reset game state on respawn
     return True, game_started
 
-def move_ghosts(ghosts, pac, LEVEL, W, H, dt, game_started):
+def move_ghosts(ghosts, pac, LEVEL, W, H, dt, game_started, comps):
+    deadline = time.perf_counter() + LOOKAHEAD_TICK_BUDGET  # Hard mode only
     for g in ghosts:
-        # Update home timer
         if g.home_timer > 0:
-            g.home_timer = max(0.0, g.home_timer - dt)
             continue  # Skip movement while in home
         
-        move_ghost_active(g, pac, dt, LEVEL, W, H)
+        move_ghost_active(g, pac, dt, LEVEL, W, H, comps, ghosts, deadline)
 
-def move_ghost_active(g, pac, dt, LEVEL, W, H):
+def move_ghost_active(g, pac, dt, LEVEL, W, H, comps, ghosts, deadline):
     at_intersection = abs(g.x - round(g.x)) < 0.1 and abs(g.y - round(g.y)) < 0.1
     
     if at_intersection or (g.dx == 0 and g.dy == 0):
@@ -205,10 +172,14 @@ def move_ghost_active(g, pac, dt, LEVEL, W, H):
             in_home = abs(g.x - W//2) < 3 and abs(g.y - H//2) < 3
             if in_home:
                 exit_target = (int(g.x), max(0, H//2 - 4))
-                ddx, ddy = astar_dir(LEVEL, (int(g.x), int(g.y)), exit_target, forbid, W, H)
+                ddx, ddy = astar_dir(LEVEL, (int(g.x), int(g.y)), exit_target, forbid, W, H, comps)
             else:
                 target = (int(pac.x), int(pac.y))
-                ddx, ddy = astar_dir(LEVEL, (int(g.x), int(g.y)), target, forbid, W, H)
+                budget = min(LOOKAHEAD_BUDGET, deadline - time.perf_counter())
+                if HARD_MODE and budget > 0 and reachable(comps, (int(g.x), int(g.y)), target):
+                    ddx, ddy = lookahead_dir(LEVEL, g, pac, ghosts, forbid, W, H, comps, budget)
+                else:
+                    ddx, ddy = astar_dir(LEVEL, (int(g.x), int(g.y)), target, forbid, W, H, comps)
         
         if ddx == 0 and ddy == 0:
             ddx, ddy = random_dir(LEVEL, (int(g.x), int(g.y)), None, W, H)
@@ -226,12 +197,15 @@ def move_ghost_active(g, pac, dt, LEVEL, W, H):
             g.dx = g.dy = 0
 
 def render_game(stdscr, LEVEL, pac, ghosts, pellets, powers, title, 
-                PAC_COLOR, GHOST_COLOR, FRIGHT_COL, MAZE_COLOR):
+                PAC_COLOR, GHOST_COLOR, FRIGHT_COL, MAZE_COLOR, latency=None):
     stdscr.erase()
 
     # Title/HUD
+    hud = f"Level: {title}  Score: {pac.score}  Power:{pac.power:4.1f}  Lives:{max(0,pac.lives)}"
+    if latency:
+        hud += f"  Lag:{latency[0]:.1f}f/{latency[1]:.0f}ms  Wait:{latency[2]:.0f}ms"
     try:
-        stdscr.addstr(0, 0, f"Level: {title}  Score: {pac.score}  Power:{pac.power:4.1f}  Lives:{max(0,pac.lives)}")
+        stdscr.addstr(0, 0, hud)
     except curses.error:
         pass
 
@@ -263,7 +237,7 @@ def render_game(stdscr, LEVEL, pac, ghosts, pellets, powers, title,
     # Ghosts
     for g in ghosts:
         if g.frightened > 0:
-            if g.frightened < 2.0 and int(g.frightened * 8) % 2:
+            if g.flashing and int(g.frightened * 8) % 2:
                 col = GHOST_COLOR
             else:
                 col = FRIGHT_COL
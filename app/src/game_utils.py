@@ -37,7 +37,7 @@ def neighbors(LEVEL, x, y, W, H):
 def manhattan(a, b): 
     return abs(a[0]-b[0]) + abs(a[1]-b[1])
 
-def astar_dir(LEVEL, src, dst, forbid, W, H):
+def astar_dir(LEVEL, src, dst, forbid, W, H, comps=None):
     start = src
     goal = dst
     
@@ -45,6 +45,10 @@ def astar_dir(LEVEL, src, dst, forbid, W, H):
     if start == goal:
         return (0, 0)
     
+    # Skip the search entirely when the target is in another component
+    if comps is not None and not reachable(comps, start, goal):
+        return greedy_dir(LEVEL, src, dst, forbid, W, H)
+    
     open_set = [(0, start, None)]  # (f_score, pos, came_from_dir)
     g_score = {start: 0}
     
@@ -68,6 +72,9 @@ def astar_dir(LEVEL, src, dst, forbid, W, H):
                 heappush(open_set, (f_score, neighbor, first_dir))
     
     # Fallback to greedy if A* fails
+    return greedy_dir(LEVEL, src, dst, forbid, W, H)
+
+def greedy_dir(LEVEL, src, dst, forbid, W, H):
     x, y = src
     opts = []
     for nx, ny, (dx, dy) in neighbors(LEVEL, x, y, W, H):
@@ -135,4 +142,30 @@ def find_default_spawns(LEVEL):
     
     # Use ghost starting positions as scatter targets
     scatters = ghost_candidates
-    return pac, ghosts, scatters
\ No newline at end of file
+    return pac, ghosts, scatters
+
+def label_components(LEVEL, W, H):
+    """Label walkable cells by connected component, honoring horizontal wrap.
+
+    Returns a dict mapping (x, y) -> component id."""
+    comps = {}
+    label = 0
+    for y in range(H):
+        for x in range(W):
+            if (x, y) in comps or is_wall(LEVEL, x, y, W, H):
+                continue
+            comps[(x, y)] = label
+            stack = [(x, y)]
+            while stack:
+                cx, cy = stack.pop()
+                for nx, ny, _ in neighbors(LEVEL, cx, cy, W, H):
+                    if (nx, ny) not in comps:
+                        comps[(nx, ny)] = label
+                        stack.append((nx, ny))
+            label += 1
+    return comps
+
+def reachable(comps, a, b):
+    """O(1) check whether tile b can be reached from tile a."""
+    ca = comps.get(a)
+    return ca is not None and ca == comps.get(b)
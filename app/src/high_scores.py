@@ -1,10 +1,21 @@
 """High score management."""
+import fcntl
 import json
 import os
+from contextlib import contextmanager
 from datetime import datetime
 
 SCORES_FILE = "/data/high_scores.json"
 
+@contextmanager
+def write_lock():
+    """Serialize writers across processes. The kernel drops an flock when
+    its holder dies, so a killed session cannot leave the scores locked."""
+    os.makedirs(os.path.dirname(SCORES_FILE), exist_ok=True)
+    with open(SCORES_FILE + ".lock", 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
 def load_high_scores():
     """Load high scores from file."""
     try:
@@ -16,17 +27,20 @@ def load_high_scores():
 def save_high_scores(scores):
     """Save high scores to file."""
     os.makedirs(os.path.dirname(SCORES_FILE), exist_ok=True)
-    with open(SCORES_FILE, 'w') as f:
+    tmp = SCORES_FILE + ".tmp"
+    with open(tmp, 'w') as f:
         json.dump(scores, f, indent=2)
+    os.replace(tmp, SCORES_FILE)  # Readers never see a partial file
 
 def add_high_score(score, initials="???"):
     """Add a new high score and return if it made the top 10."""
-    scores = load_high_scores()
-    entry = {"score": score, "initials": initials, "date": datetime.now().isoformat()[:19]}
-    scores.append(entry)
-    scores.sort(key=lambda x: x["score"], reverse=True)
-    scores = scores[:10]  # Keep top 10
-    save_high_scores(scores)
+    with write_lock():
+        scores = load_high_scores()
+        entry = {"score": score, "initials": initials, "date": datetime.now().isoformat()[:19]}
+        scores.append(entry)
+        scores.sort(key=lambda x: x["score"], reverse=True)
+        scores = scores[:10]  # Keep top 10
+        save_high_scores(scores)
     return entry in scores
 
 def is_high_score(score):
@@ -0,0 +1,128 @@
+"""Keyboard input: drains pending keys each frame and buffers turns."""
+import curses
+import os
+import select
+import sys
+import time
+from collections import deque
+from game_utils import wrap_xy, is_wall
+
+SHOW_LATENCY = bool(os.environ.get('CMAN_LATENCY'))
+LATENCY_WINDOW = 30  # Samples kept for the running averages
+
+QUIT_KEYS = (ord('q'), ord('Q'))
+PAUSE_KEYS = (ord('p'), ord('P'))
+KEY_DIRS = {
+    curses.KEY_UP: (0, -1), ord('w'): (0, -1), ord('W'): (0, -1),
+    curses.KEY_DOWN: (0, 1), ord('s'): (0, 1), ord('S'): (0, 1),
+    curses.KEY_LEFT: (-1, 0), ord('a'): (-1, 0), ord('A'): (-1, 0),
+    curses.KEY_RIGHT: (1, 0), ord('d'): (1, 0), ord('D'): (1, 0),
+}
+
+class InputState:
+    def __init__(self):
+        self.paused = False
+        self.frame = 0
+        self.key_arrived = None  # (frame, time) input first became readable
+        self.pending = None      # (drain frame, press frame, press time) of unapplied turn
+        self.awaiting_move = None  # (press frame, press time, dir) of an applied turn
+        self.move_frames = deque(maxlen=LATENCY_WINDOW)
+        self.move_ms = deque(maxlen=LATENCY_WINDOW)
+        self.turn_wait_ms = deque(maxlen=LATENCY_WINDOW)
+
+    def latency(self):
+        """Windowed averages: press-to-move (frames, ms) and buffered-turn wait (ms).
+
+        Press-to-move only counts turns that were legal when pressed, so it
+        reflects the input pipeline; turns queued at a wall go to the wait."""
+        def avg(samples):
+            return sum(samples) / len(samples) if samples else 0.0
+        return avg(self.move_frames), avg(self.move_ms), avg(self.turn_wait_ms)
+
+    def track_move(self, pac, moved):
+        """Call after Cman moves; closes the press-to-move sample once it does."""
+        if not self.awaiting_move:
+            return
+        frame, pressed, want = self.awaiting_move
+        if (pac.dx, pac.dy) != want:
+            self.awaiting_move = None  # Overridden by a newer turn
+        elif moved:
+            self.move_frames.append(self.frame - frame)
+            self.move_ms.append((time.perf_counter() - pressed) * 1000)
+            self.awaiting_move = None
+
+def wait_frame(inp, seconds):
+    """Sleep until the next frame, noting when the first key arrives."""
+    end = time.perf_counter() + seconds
+    while True:
+        remaining = end - time.perf_counter()
+        if remaining <= 0:
+            return
+        if inp.key_arrived is not None:
+            time.sleep(remaining)
+            return
+        try:
+            ready, _, _ = select.select([sys.stdin], [], [], remaining)
+        except (OSError, ValueError):
+            time.sleep(remaining)
+            return
+        if ready:
+            inp.key_arrived = (inp.frame, time.perf_counter())
+
+def drain_keys(stdscr):
+    """Return every key currently waiting in the input buffer."""
+    keys = []
+    while True:
+        try:
+            ch = stdscr.getch()
+        except curses.error:
+            break
+        if ch == -1:
+            break
+        keys.append(ch)
+    return keys
+
+def handle_input(stdscr, pac, inp, H, W, LEVEL):
+    """Process this frame's keys. Returns False when the player quits."""
+    inp.frame += 1
+    keys = drain_keys(stdscr)
+    arrived = inp.key_arrived or (inp.frame, time.perf_counter())
+    inp.key_arrived = None
+    for ch in keys:
+        if ch in QUIT_KEYS:
+            return False
+        if inp.paused:
+            inp.paused = False  # Any key resumes
+        elif ch in PAUSE_KEYS:
+            inp.paused = True
+        elif ch in KEY_DIRS:
+            want = KEY_DIRS[ch]
+            if want == (pac.dx, pac.dy):
+                inp.pending = None
+            elif want != pac.want or inp.pending is None:
+                inp.pending = (inp.frame,) + arrived
+            pac.want = want  # Latest key wins
+
+    if inp.paused:
+        msg_text = "PAUSED"
+        try:
+            stdscr.addstr(max(1, H//2), max(0, (W - len(msg_text)) // 2), msg_text)
+        except curses.error:
+            pass
+        stdscr.refresh()
+        return True
+
+    # Buffered turn: keep trying the wanted direction until the wall allows it
+    want = pac.want
+    if want != (0, 0) and want != (pac.dx, pac.dy):
+        nx, ny = wrap_xy(pac.x + want[0], pac.y + want[1], W, H)
+        if not is_wall(LEVEL, int(nx), int(ny), W, H):
+            pac.dx, pac.dy = want
+    if inp.pending and (pac.dx, pac.dy) == want:
+        drained, frame, pressed = inp.pending
+        if drained == inp.frame:
+            inp.awaiting_move = (frame, pressed, want)
+        else:
+            inp.turn_wait_ms.append((time.perf_counter() - pressed) * 1000)
+        inp.pending = None
+    return True
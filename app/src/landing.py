@@ -2,8 +2,10 @@
 import curses
 from high_scores import get_top_scores
 
-def show_landing(stdscr):
-    """Show landing page with leaderboard."""
+def show_landing(stdscr, on_first_frame=None):
+    """Show landing page with leaderboard.
+
+    on_first_frame, if given, is called once the first frame is drawn."""
     curses.curs_set(0)
     stdscr.nodelay(False)
     
@@ -35,6 +37,9 @@ def show_landing(stdscr):
             pass
         
         stdscr.refresh()
+        if on_first_frame:
+            on_first_frame()
+            on_first_frame = None
         
         ch = stdscr.getch()
         if ch in (10, 13):  # Enter
@@ -1,17 +1,38 @@
 """Level loading and management."""
 import os
 import sys
+from game_utils import (label_components, reachable, neighbors,
+                        make_pellet_map, find_default_spawns)
 
 LEVEL_DIR = os.path.join(os.path.dirname(__file__), "..", "levels")
+DEAD_END_WARN = 0.05  # Warn when more than this share of Cman's area is dead ends
+
+# Parsed levels, filled by preload_levels() so forked workers share them
+_LEVEL_CACHE = {}
+
+# Zipapp builds embed the levels (already validated) as a bytecode module
+try:
+    from frozen_levels import LEVELS as FROZEN_LEVELS
+    _LEVEL_CACHE.update(FROZEN_LEVELS)
+except ImportError:
+    FROZEN_LEVELS = None
 
 def list_level_files():
+    if FROZEN_LEVELS is not None:
+        return sorted(FROZEN_LEVELS)
     if not os.path.isdir(LEVEL_DIR):
         return []
     files = [f for f in os.listdir(LEVEL_DIR) if f.lower().endswith(".txt")]
     files.sort()
     return files
 
-def load_level_file(filename):
+def preload_levels():
+    """Load and validate every level once (before forking session workers)."""
+    for filename in list_level_files():
+        _LEVEL_CACHE[filename] = tuple(load_level_file(filename))
+    return len(_LEVEL_CACHE)
+
+def read_level_lines(filename):
     path = os.path.join(LEVEL_DIR, filename)
     with open(path, "r", encoding="utf-8") as f:
         lines = [line.rstrip("\n") for line in f]
@@ -24,6 +45,40 @@ def load_level_file(filename):
             raise ValueError(f"Row {i} length {len(line)} != {width} (level must be rectangular)")
     return lines
 
+def load_level_file(filename):
+    if filename in _LEVEL_CACHE:
+        return list(_LEVEL_CACHE[filename])  # Callers mutate spawn markers
+    lines = read_level_lines(filename)
+    report = analyze_level(lines)
+    if report["unreachable_pellets"]:
+        raise ValueError(f"{len(report['unreachable_pellets'])} pellet(s) unreachable from Cman spawn: "
+                         f"{sorted(report['unreachable_pellets'])[:5]}")
+    if report["isolated_spawns"]:
+        raise ValueError(f"Ghost spawn(s) cannot reach Cman: {sorted(report['isolated_spawns'])}")
+    if report["dead_end_density"] > DEAD_END_WARN:
+        print(f"Warning: {filename} has {report['dead_ends']} dead ends "
+              f"({report['dead_end_density']:.0%} of walkable tiles)", file=sys.stderr)
+    return lines
+
+def analyze_level(lines):
+    """Report connectivity problems in a level: unreachable pellets,
+    isolated ghost spawns and dead-end density of Cman's area."""
+    H = len(lines)
+    W = len(lines[0])
+    comps = label_components(lines, W, H)
+    pac, ghosts, _ = find_default_spawns(list(lines))
+    pellets, powers = make_pellet_map(lines)
+
+    area = [pos for pos, c in comps.items() if c == comps.get(pac)]
+    dead_ends = sum(1 for x, y in area if len(list(neighbors(lines, x, y, W, H))) == 1)
+    return {
+        "components": len(set(comps.values())),
+        "unreachable_pellets": [p for p in pellets | powers if not reachable(comps, pac, p)],
+        "isolated_spawns": [g for g in ghosts if not reachable(comps, pac, g)],
+        "dead_ends": dead_ends,
+        "dead_end_density": dead_ends / len(area) if area else 0.0,
+    }
+
 def get_initial_level():
     """Get initial level from LEVEL env var or return None for default behavior"""
     level_env = os.environ.get('LEVEL')
@@ -61,4 +116,26 @@ def choose_level_interactive():
             print(f"Loading: {cand}")
             return load_level_file(cand), inp
         else:
-            print(f"'{inp}' not found.")
\ No newline at end of file
+            print(f"'{inp}' not found.")
+
+def print_level_report():
+    """Print the analysis for every level; exit non-zero if any is broken."""
+    broken = 0
+    for filename in list_level_files():
+        try:
+            report = analyze_level(read_level_lines(filename))
+        except ValueError as e:
+            print(f"{filename}: BROKEN ({e})")
+            broken += 1
+            continue
+        problems = len(report["unreachable_pellets"]) + len(report["isolated_spawns"])
+        broken += bool(problems)
+        print(f"{filename}: {'BROKEN' if problems else 'ok'}  "
+              f"components={report['components']}  "
+              f"unreachable_pellets={len(report['unreachable_pellets'])}  "
+              f"isolated_spawns={len(report['isolated_spawns'])}  "
+              f"dead_ends={report['dead_ends']} ({report['dead_end_density']:.1%})")
+    return broken
+
+if __name__ == "__main__":
+    sys.exit(1 if print_level_report() else 0)
\ No newline at end of file
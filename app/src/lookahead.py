@@ -0,0 +1,204 @@
+"""Lookahead ghost AI: short rollouts on a tile snapshot to trap Cman."""
+import os
+import random
+import sys
+import time
+from collections import deque
+from config import LOOKAHEAD_DEPTH, LOOKAHEAD_BUDGET, LOOKAHEAD_MIN_SAMPLES
+from game_utils import neighbors, is_wall, astar_dir
+
+HARD_MODE = os.environ.get('DIFFICULTY', '').lower() == 'hard'
+
+CAUGHT = 1000  # Rollout score bonus for catching Cman
+
+# Decision counters, reported by the --compare benchmark
+stats = {"decided": 0, "fallback": 0, "rounds": 0}
+
+# Adjacency and BFS distances for the level in play, built lazily
+_maze = {"level": None, "adj": {}, "dist": {}}
+
+def maze_adjacency(LEVEL, W, H):
+    """Walkable tile -> [(neighbor tile, direction)], rebuilt when the level changes."""
+    if _maze["level"] is not LEVEL:
+        adj = {}
+        for y in range(H):
+            for x in range(W):
+                if not is_wall(LEVEL, x, y, W, H):
+                    adj[(x, y)] = [((nx, ny), d) for nx, ny, d in neighbors(LEVEL, x, y, W, H)]
+        _maze.update(level=LEVEL, adj=adj, dist={})
+    return _maze["adj"]
+
+def maze_distances(adj, src):
+    """BFS distances from src (honoring wrap), cached per source tile."""
+    dist = _maze["dist"].get(src)
+    if dist is None:
+        dist = {src: 0}
+        queue = deque([src])
+        while queue:
+            cur = queue.popleft()
+            for nxt, _ in adj.get(cur, ()):
+                if nxt not in dist:
+                    dist[nxt] = dist[cur] + 1
+                    queue.append(nxt)
+        _maze["dist"][src] = dist
+    return dist
+
+def _step_options(adj, tile, d):
+    """Moves from tile that don't reverse d (all moves at a dead end)."""
+    opts = adj.get(tile, ())
+    back = (-d[0], -d[1])
+    forward = [o for o in opts if o[1] != back]
+    return forward or opts
+
+def clone_state(pac, ghosts):
+    """Copy the live entities into the tile tuples rollouts mutate.
+
+    Returns (cman tile, cman dir, [(ghost tile, ghost dir), ...]); timers
+    play no part in a rollout, so nothing else is copied."""
+    return ((int(pac.x), int(pac.y)), (pac.dx, pac.dy),
+            [((int(g.x), int(g.y)), (g.dx, g.dy)) for g in ghosts])
+
+def rollout(adj, pac, pdir, ghosts, idx, first, depth=LOOKAHEAD_DEPTH):
+    """Play one random future on tile tuples where ghost idx starts with `first`.
+
+    pac/pdir are Cman's tile and direction, ghosts a list of (tile, dir).
+    Cman wanders without reversing, the other ghosts chase along maze
+    distance. Returns CAUGHT plus the steps left if Cman is caught,
+    otherwise minus ghost idx's maze distance to Cman."""
+    far = len(adj)
+    tiles = [t for t, _ in ghosts]
+    dirs = [d for _, d in ghosts]
+    for t in range(depth):
+        opts = _step_options(adj, pac, pdir)
+        if opts:
+            pac, pdir = random.choice(opts)
+        dist = maze_distances(adj, pac)
+        for i in range(len(tiles)):
+            if tiles[i] == pac:
+                return CAUGHT + depth - t
+            if t == 0 and i == idx:
+                nxt = next(((n, d) for n, d in adj.get(tiles[i], ()) if d == first), None)
+            else:
+                opts = _step_options(adj, tiles[i], dirs[i])
+                nxt = min(opts, key=lambda o: dist.get(o[0], far)) if opts else None
+            if nxt:
+                tiles[i], dirs[i] = nxt
+            if tiles[i] == pac:
+                return CAUGHT + depth - t
+    return -maze_distances(adj, pac).get(tiles[idx], far)
+
+def lookahead_dir(LEVEL, g, pac, ghosts, forbid, W, H, comps, budget=LOOKAHEAD_BUDGET):
+    """Pick ghost g's direction from rollouts, or fall back to A*.
+
+    Candidates are sampled round-robin until the budget runs out. If fewer
+    than LOOKAHEAD_MIN_SAMPLES rounds fit, or the best candidate's mean is
+    not clearly above the runner-up's, A* toward Cman decides instead."""
+    adj = maze_adjacency(LEVEL, W, H)
+    src = (int(g.x), int(g.y))
+    cands = [d for _, d in adj.get(src, ()) if d != forbid]
+    if len(cands) <= 1:
+        return cands[0] if cands else (0, 0)
+
+    target, pdir, ghost_s = clone_state(pac, ghosts)
+    idx = ghosts.index(g)
+
+    sums = dict.fromkeys(cands, 0.0)
+    squares = dict.fromkeys(cands, 0.0)
+    rounds = 0
+    deadline = time.perf_counter() + budget
+    while time.perf_counter() < deadline or rounds == 0:
+        for d in cands:
+            score = rollout(adj, target, pdir, ghost_s, idx, d)
+            sums[d] += score
+            squares[d] += score * score
+        rounds += 1
+    stats["rounds"] += rounds
+
+    if rounds >= LOOKAHEAD_MIN_SAMPLES:
+        def mean_err(d):
+            mean = sums[d] / rounds
+            var = max(0.0, squares[d] / rounds - mean * mean)
+            return mean, (var / rounds) ** 0.5
+        ranked = sorted(cands, key=lambda d: sums[d], reverse=True)
+        (m1, e1), (m2, e2) = mean_err(ranked[0]), mean_err(ranked[1])
+        if m1 - m2 > e1 + e2:
+            stats["decided"] += 1
+            return ranked[0]
+    stats["fallback"] += 1
+    return astar_dir(LEVEL, src, target, forbid, W, H, comps)
+
+def _compare(LEVEL, trials, steps):
+    """Tile-level games: a fleeing Cman against A* ghosts vs lookahead ghosts."""
+    from entities import Cman, Ghost
+    from game_utils import find_default_spawns, label_components
+
+    H, W = len(LEVEL), len(LEVEL[0])
+    pac_start, ghost_starts, _ = find_default_spawns(LEVEL)
+    comps = label_components(LEVEL, W, H)
+    adj = maze_adjacency(LEVEL, W, H)
+
+    def play(mode, seed):
+        random.seed(seed)
+        pac = Cman(pac_start)
+        ghosts = [Ghost(s, s) for s in ghost_starts]
+        think = 0.0
+        for step in range(steps):
+            # Cman flees: the move that keeps it farthest from the nearest ghost
+            here = (int(pac.x), int(pac.y))
+            opts = adj.get(here, ())
+            if opts:
+                def safety(o):
+                    dist = maze_distances(adj, o[0])
+                    return min(dist.get((int(gg.x), int(gg.y)), len(adj)) for gg in ghosts) + random.random()
+                (pac.x, pac.y), (pac.dx, pac.dy) = max(opts, key=safety)
+            for gg in ghosts:
+                pos = (int(gg.x), int(gg.y))
+                if pos == (int(pac.x), int(pac.y)):
+                    return step, think
+                forbid = (-gg.dx, -gg.dy) if (gg.dx, gg.dy) != (0, 0) else None
+                start = time.perf_counter()
+                if mode == "hard":
+                    d = lookahead_dir(LEVEL, gg, pac, ghosts, forbid, W, H, comps)
+                else:
+                    d = astar_dir(LEVEL, pos, (int(pac.x), int(pac.y)), forbid, W, H, comps)
+                think += time.perf_counter() - start
+                nxt = next((n for n, dd in adj.get(pos, ()) if dd == d), None)
+                if nxt:
+                    (gg.x, gg.y), (gg.dx, gg.dy) = nxt, d
+                if nxt == (int(pac.x), int(pac.y)):
+                    return step, think
+        return None, think
+
+    for mode in ("normal", "hard"):
+        stats.update(decided=0, fallback=0, rounds=0)
+        results = [play(mode, seed) for seed in range(trials)]
+        caught = [s for s, _ in results if s is not None]
+        think_ms = sum(t for _, t in results) * 1000 / trials
+        avg = f"{sum(caught) / len(caught):.0f}" if caught else "-"
+        print(f"{mode:>6}: caught {len(caught)}/{trials}, avg steps to catch {avg}, "
+              f"{think_ms:.0f} ms thinking per game")
+    calls = stats["decided"] + stats["fallback"]
+    if calls:
+        print(f"        rollouts chose {stats['decided']}/{calls} intersections, "
+              f"{stats['rounds'] / calls:.1f} rounds per decision")
+
+if __name__ == "__main__":
+    # python3 lookahead.py [LEVEL] [--compare]
+    from level_loader import load_level_file
+    from game_utils import find_default_spawns
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    LEVEL = load_level_file((args[0] if args else "001") + ".txt")
+    if "--compare" in sys.argv:
+        _compare(LEVEL, trials=20, steps=150)
+        sys.exit(0)
+
+    H, W = len(LEVEL), len(LEVEL[0])
+    pac_start, ghost_starts, _ = find_default_spawns(LEVEL)
+    adj = maze_adjacency(LEVEL, W, H)
+    ghosts = [(s, (0, 0)) for s in ghost_starts]
+    n, start = 0, time.perf_counter()
+    while time.perf_counter() - start < 1.0:
+        rollout(adj, pac_start, (0, 0), ghosts, 0, (0, 0))
+        n += 1
+    print(f"{n} rollouts/s ({n * LOOKAHEAD_DEPTH * (len(ghosts) + 1)} entity steps/s)")
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Session supervisor: hosts many players on a pre-forked worker pool.
+
+Each TCP connection is handed to the least-loaded worker, which runs the
+game for it on a pseudo-terminal. Levels and code are loaded once before
+forking so workers share them copy-on-write.
+
+    python3 supervisor.py --workers 4 --port 2323
+    socat -,raw,echo=0 tcp:localhost:2323     # play
+    python3 supervisor.py --check 8           # loopback smoke test
+"""
+import argparse
+import fcntl
+import json
+import multiprocessing as mp
+import os
+import pty
+import selectors
+import signal
+import socket
+import struct
+import sys
+import termios
+import time
+import traceback
+from multiprocessing.reduction import send_handle, recv_handle
+
+import cman
+import game_engine  # cman imports it lazily; preload so sessions share it
+import game_state
+from level_loader import preload_levels
+
+STATS_FILE = "/tmp/cman_workers.json"
+STATS_INTERVAL = 2.0
+SESSION_SIZE = (50, 120)  # Terminal rows, cols given to each session
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+MAX_BACKLOG = 256 * 1024  # Bytes buffered per direction before a session is dropped
+
+def cpu_seconds(pid):
+    """User+system CPU time of a process (Linux /proc), None if it is gone."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / CLK_TCK
+    except (OSError, IndexError, ValueError):
+        return None
+
+class CpuMeter:
+    """Cumulative CPU of a changing set of processes.
+
+    Only per-pid increases are added, so the total never drops when a
+    session exits and its own counter disappears."""
+
+    def __init__(self):
+        self.total = 0.0
+        self.seen = {}  # pid -> last CPU seconds read
+
+    def sample(self, pids):
+        seen = {}
+        for pid in pids:
+            cpu = cpu_seconds(pid)
+            if cpu is None:
+                continue
+            self.total += max(0.0, cpu - self.seen.get(pid, 0.0))
+            seen[pid] = cpu
+        self.seen = seen
+        return self.total
+
+def start_session(sock, inherited):
+    """Fork a game process on a new pty. Returns (pid, master_fd)."""
+    errors = os.dup(2)  # The game's own stderr is the pty; crashes go to the worker's
+    pid, master = pty.fork()
+    if pid == 0:
+        for fd in inherited:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        for sig in (signal.SIGINT, signal.SIGCHLD, signal.SIGHUP):
+            signal.signal(sig, signal.SIG_DFL)
+        os.environ.setdefault("TERM", "xterm-256color")
+        # Score/lives carried between levels belong to this player only
+        game_state.STATE_FILE = f"/tmp/cman_state_{os.getpid()}.json"
+        status = 0
+        try:
+            cman.main()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        except Exception:
+            os.write(errors, f"Session {os.getpid()} crashed:\n{traceback.format_exc()}".encode())
+            status = 1
+        game_state.clear_game_state()
+        os._exit(status)
+    os.close(errors)
+    fcntl.ioctl(master, termios.TIOCSWINSZ, struct.pack("HHHH", *SESSION_SIZE, 0, 0))
+    return pid, master
+
+class Session:
+    """One player: client socket, game pty and the bytes waiting for each."""
+
+    def __init__(self, pid, sock, master):
+        self.pid = pid
+        self.sock = sock
+        self.master = master
+        self.to_client = bytearray()
+        self.to_game = bytearray()
+
+def worker_main(conn, listener, supervisor_ends):
+    """Relay bytes between client sockets and their game ptys.
+
+    All fds are non-blocking and each direction is buffered, so a slow
+    client only stalls its own session; one whose backlog exceeds
+    MAX_BACKLOG is dropped."""
+    listener.close()
+    for end in supervisor_ends:
+        end.close()  # So the worker sees EOF when the supervisor exits
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # Kernel reaps finished games
+    sel = selectors.DefaultSelector()
+    sel.register(conn, selectors.EVENT_READ, "control")
+    sessions = {}  # pid -> Session
+    cpu = CpuMeter()
+    last_report = 0.0
+
+    def watch(sess):
+        """Register interest in writes only while a buffer is pending."""
+        sel.modify(sess.sock, selectors.EVENT_READ |
+                   (selectors.EVENT_WRITE if sess.to_client else 0), ("sock", sess.pid))
+        sel.modify(sess.master, selectors.EVENT_READ |
+                   (selectors.EVENT_WRITE if sess.to_game else 0), ("pty", sess.pid))
+
+    def end_session(pid):
+        cpu.sample([os.getpid()] + list(sessions))  # Final reading while pid may still exist
+        sess = sessions.pop(pid)
+        for obj in (sess.sock, sess.master):
+            try:
+                sel.unregister(obj)
+            except (KeyError, ValueError):
+                pass
+        sess.sock.close()
+        os.close(sess.master)
+        try:
+            os.kill(pid, signal.SIGHUP)
+        except ProcessLookupError:
+            pass
+
+    def pump(sess, src, events):
+        """Move bytes for one ready fd. Returns False when the session is over."""
+        try:
+            if src == "sock":
+                if events & selectors.EVENT_READ:
+                    data = sess.sock.recv(4096)
+                    if not data:
+                        return False
+                    sess.to_game += data
+                if events & selectors.EVENT_WRITE and sess.to_client:
+                    del sess.to_client[:sess.sock.send(sess.to_client)]
+            else:
+                if events & selectors.EVENT_READ:
+                    data = os.read(sess.master, 4096)
+                    if not data:
+                        return False
+                    sess.to_client += data
+                if events & selectors.EVENT_WRITE and sess.to_game:
+                    del sess.to_game[:os.write(sess.master, sess.to_game)]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            return False
+        return len(sess.to_client) <= MAX_BACKLOG and len(sess.to_game) <= MAX_BACKLOG
+
+    while True:
+        for key, events in sel.select(timeout=STATS_INTERVAL):
+            kind = key.data
+            if kind == "control":
+                try:
+                    conn.recv()
+                    fd = recv_handle(conn)
+                except (EOFError, OSError):
+                    return  # Supervisor is gone
+                sock = socket.socket(fileno=fd)
+                inherited = [conn.fileno()] + [fd for sess in sessions.values()
+                                               for fd in (sess.sock.fileno(), sess.master)] + [sock.fileno()]
+                pid, master = start_session(sock, inherited)
+                sock.setblocking(False)
+                os.set_blocking(master, False)
+                sessions[pid] = Session(pid, sock, master)
+                sel.register(sock, selectors.EVENT_READ, ("sock", pid))
+                sel.register(master, selectors.EVENT_READ, ("pty", pid))
+                last_report = 0.0
+            else:
+                src, pid = kind
+                sess = sessions.get(pid)
+                if sess is None:
+                    continue
+                if pump(sess, src, events):
+                    watch(sess)
+                else:
+                    end_session(pid)
+                    last_report = 0.0
+
+        # Drop sessions whose game has exited
+        for pid in list(sessions):
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done:
+                end_session(pid)
+                last_report = 0.0
+
+        now = time.monotonic()
+        if now - last_report >= STATS_INTERVAL or last_report == 0.0:
+            last_report = now
+            try:
+                conn.send(("status", len(sessions), cpu.sample([os.getpid()] + list(sessions))))
+            except (EOFError, OSError):
+                return  # Supervisor is gone
+
+class Supervisor:
+    def __init__(self, workers, host, port):
+        self.size = workers
+        self.listener = socket.create_server((host, port))
+        self.workers = {}  # slot -> dict(process, conn, sessions, cpu, load, at)
+        self.sel = selectors.DefaultSelector()
+        self.sel.register(self.listener, selectors.EVENT_READ, "accept")
+
+    def spawn(self, slot):
+        parent, child = mp.Pipe()
+        ends = [parent] + [w["conn"] for s, w in self.workers.items() if s != slot]
+        proc = mp.Process(target=worker_main, args=(child, self.listener, ends), daemon=True)
+        proc.start()
+        child.close()
+        self.workers[slot] = {"process": proc, "conn": parent, "sessions": 0,
+                              "cpu": None, "load": 0.0, "at": time.monotonic(),
+                              "restarts": self.workers.get(slot, {}).get("restarts", -1) + 1}
+        self.sel.register(parent, selectors.EVENT_READ, slot)
+
+    def retire(self, slot):
+        w = self.workers[slot]
+        self.sel.unregister(w["conn"])
+        w["conn"].close()
+        w["process"].join(timeout=1)
+
+    def assign(self, client):
+        slot = min(self.workers, key=lambda s: (self.workers[s]["sessions"], self.workers[s]["load"]))
+        w = self.workers[slot]
+        try:
+            w["conn"].send("session")
+            send_handle(w["conn"], client.fileno(), w["process"].pid)
+            w["sessions"] += 1  # Until the worker reports back
+        except OSError:
+            pass
+        client.close()
+
+    def write_stats(self):
+        stats = [{"worker": slot, "pid": w["process"].pid, "sessions": w["sessions"],
+                  "cpu_load": round(w["load"], 3), "restarts": w["restarts"]}
+                 for slot, w in sorted(self.workers.items())]
+        with open(STATS_FILE, 'w') as f:
+            json.dump(stats, f, indent=2)
+
+    def run(self):
+        preload_levels()
+        for slot in range(self.size):
+            self.spawn(slot)
+        last_stats = 0.0
+        while True:
+            for key, _ in self.sel.select(timeout=STATS_INTERVAL):
+                if key.data == "accept":
+                    client, _ = self.listener.accept()
+                    self.assign(client)
+                    continue
+                w = self.workers[key.data]
+                try:
+                    _, sessions, cpu = w["conn"].recv()
+                except (EOFError, OSError):
+                    continue  # Restarted below
+                now = time.monotonic()
+                if w["cpu"] is not None:
+                    w["load"] = max(0.0, cpu - w["cpu"]) / max(now - w["at"], 1e-6)
+                w["sessions"], w["cpu"], w["at"] = sessions, cpu, now
+
+            # Restart crashed workers
+            for slot, w in list(self.workers.items()):
+                if not w["process"].is_alive():
+                    print(f"Worker {slot} exited ({w['process'].exitcode}), restarting")
+                    self.retire(slot)
+                    self.spawn(slot)
+
+            if time.monotonic() - last_stats >= STATS_INTERVAL:
+                last_stats = time.monotonic()
+                self.write_stats()
+
+def loopback_check(host, port, clients):
+    """Open several sessions, wait for the landing page, then quit each."""
+    socks = [socket.create_connection((host, port)) for _ in range(clients)]
+    ok = 0
+    for s in socks:
+        s.settimeout(10)
+        buf = b""
+        try:
+            while b"HIGH SCORES" not in buf:
+                data = s.recv(4096)
+                if not data:
+                    break
+                buf += data
+        except socket.timeout:
+            pass
+        if b"HIGH SCORES" in buf:
+            ok += 1
+    print(f"{ok}/{clients} loopback sessions reached the landing page")
+    time.sleep(STATS_INTERVAL * 1.5)
+    with open(STATS_FILE) as f:
+        print(f.read())
+    for s in socks:
+        s.sendall(b"q")
+        s.close()
+    return ok == clients
+
+def main():
+    parser = argparse.ArgumentParser(description="Host Cman sessions on a worker pool.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=2323)
+    parser.add_argument("--check", type=int, metavar="N",
+                        help="start a local supervisor and run N loopback clients")
+    args = parser.parse_args()
+
+    mp.set_start_method("fork")
+    if args.check:
+        sup = Supervisor(args.workers, "127.0.0.1", 0)
+        port = sup.listener.getsockname()[1]
+        proc = mp.Process(target=sup.run)  # Workers exit when it does
+        proc.start()
+        time.sleep(STATS_INTERVAL + 0.5)
+        passed = loopback_check("127.0.0.1", port, args.check)
+        proc.terminate()
+        sys.exit(0 if passed else 1)
+
+    print(f"Cman supervisor: {args.workers} workers on {args.host}:{args.port}")
+    Supervisor(args.workers, args.host, args.port).run()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,52 @@
+"""Event scheduler for timed effects (power-ups, shields, frightened, home)."""
+import heapq
+from itertools import count
+
+class Timer:
+    __slots__ = ("scheduler", "due", "callback", "done")
+
+    def __init__(self, scheduler, due, callback):
+        self.scheduler = scheduler
+        self.due = due
+        self.callback = callback
+        self.done = False
+
+    def remaining(self):
+        if self.done:
+            return 0.0
+        return max(0.0, self.due - self.scheduler.now)
+
+    def cancel(self):
+        self.done = True
+
+class Scheduler:
+    """Min-heap of timers on a game clock advanced by each frame's dt.
+
+    A tick only pops the timers that are due, so its cost follows the
+    number of expiring events rather than the number of entities."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = count()
+
+    def schedule(self, delay, callback=None):
+        timer = Timer(self, self.now + delay, callback)
+        heapq.heappush(self._heap, (timer.due, next(self._seq), timer))
+        return timer
+
+    def reschedule(self, timer, delay, callback=None):
+        """Cancel timer (if any) and start a fresh one."""
+        if timer is not None:
+            timer.cancel()
+        return self.schedule(delay, callback)
+
+    def advance(self, dt):
+        self.now += dt
+        heap = self._heap
+        while heap and heap[0][0] <= self.now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.done:
+                timer.done = True
+                if timer.callback:
+                    timer.callback()